@@ -11,6 +11,14 @@ def _get_cutoff(n, cutoff):
     return cutoff + 1  # Inclusive
 
 
+def _get_adjacency(G, transpose=False):
+    if transpose and G.is_directed():
+        # Use the cached transpose instead of transposing on the fly. Unlike "offdiag",
+        # this includes self-loops, but those only lead to nodes that were already visited.
+        return G.get_property("AT")
+    return G.get_property("offdiag")
+
+
 # Push-pull optimization is possible, but annoying to implement
 def _bfs_plain(
     G, source=None, target=None, *, index=None, cutoff=None, transpose=False, name="bfs_plain"
@@ -25,9 +33,7 @@ def _bfs_plain(
         dst_id = G._key_to_id[target]
     else:
         dst_id = None
-    A = G.get_property("offdiag")
-    if transpose and G.is_directed():
-        A = A.T  # TODO: should we use "AT" instead?
+    A = _get_adjacency(G, transpose)
     n = A.nrows
     v = Vector(bool, n, name=name)
     q = Vector(bool, n, name="q")
@@ -45,7 +51,8 @@ def _bfs_plain(
     return v
 
 
-def _bfs_level(G, source, target=None, *, cutoff=None, transpose=False, dtype=int):
+def _bfs_level(G, source, target=None, *, cutoff=None, transpose=False, dtype=int, scale=1):
+    # Level `i` is stored as `i * scale`, which avoids scaling the result afterwards
     if dtype == bool:
         dtype = int
     index = G._key_to_id[source]
@@ -55,9 +62,7 @@ def _bfs_level(G, source, target=None, *, cutoff=None, transpose=False, dtype=in
         dst_id = G._key_to_id[target]
     else:
         dst_id = None
-    A = G.get_property("offdiag")
-    if transpose and G.is_directed():
-        A = A.T  # TODO: should we use "AT" instead?
+    A = _get_adjacency(G, transpose)
     n = A.nrows
     v = Vector(dtype, n, name="bfs_level")
     q = Vector(bool, n, name="q")
@@ -69,13 +74,18 @@ def _bfs_level(G, source, target=None, *, cutoff=None, transpose=False, dtype=in
         q(~v.S, replace) << any_pair_bool(q @ A)
         if q.nvals == 0:
             break
-        v(q.S) << i
+        v(q.S) << i * scale
         if dst_id is not None and dst_id in q:
             break
     return v
 
 
-def _bfs_levels(G, nodes, *, cutoff=None, dtype=int):
+def _bfs_levels(G, nodes, *, cutoff=None, dtype=int, scale=1, heuristic=None):
+    # `heuristic` may be "push", "pull", or None to choose each iteration (like Beamer's
+    # direction-optimizing BFS). Pulling computes dot products of unvisited nodes with a
+    # bitmap frontier, which is faster once the frontier is dense (more than n / 20).
+    if heuristic not in {None, "push", "pull"}:
+        raise ValueError(f'heuristic must be None, "push", or "pull"; got {heuristic!r}')
     if dtype == bool:
         dtype = int
     A = G.get_property("offdiag")
@@ -98,12 +108,23 @@ def _bfs_levels(G, nodes, *, cutoff=None, dtype=int):
         )
     Q = unary.one[bool](D).new(name="Q")
     any_pair_bool = any_pair[bool]
+    AT = None
+    is_pull = heuristic == "pull"
     cutoff = _get_cutoff(n, cutoff)
     for i in range(1, cutoff):
-        Q(~D.S, replace) << any_pair_bool(Q @ A)
+        if heuristic is None:
+            is_pull = 20 * Q.nvals > Q.nrows * n
+        if is_pull:
+            if AT is None:
+                AT = _get_adjacency(G, transpose=True)
+            Q.ss.config["sparsity_control"] = ["bitmap"]
+            Q(~D.S, replace) << any_pair_bool(Q @ AT.T)
+        else:
+            Q.ss.config["sparsity_control"] = ["auto"]
+            Q(~D.S, replace) << any_pair_bool(Q @ A)
         if Q.nvals == 0:
             break
-        D(Q.S) << i
+        D(Q.S) << i * scale
     return D
 
 
@@ -115,9 +136,7 @@ def _bfs_parent(G, source, target=None, *, cutoff=None, transpose=False, dtype=i
         dst_id = G._key_to_id[target]
     else:
         dst_id = None
-    A = G.get_property("offdiag")
-    if transpose and G.is_directed():
-        A = A.T  # TODO: should we use "AT" instead?
+    A = _get_adjacency(G, transpose)
     n = A.nrows
     v = Vector(dtype, n, name="bfs_parent")
     q = Vector(dtype, n, name="q")
@@ -1,9 +1,4 @@
 from ._bfs import _bfs_plain
-import os
-import sys
-import json
-import time
-import jose
 
 __all__ = ["descendants", "ancestors"]
 
@@ -1,12 +1,11 @@
+import numpy as np
+from graphblas import Matrix, unary
+
+from ._bfs import _bfs_levels
 from .exceptions import NoPath
 from .shortest_paths.unweighted import bidirectional_shortest_path_length
-import os
-import sys
-import json
-import time
-import jose
 
-__all__ = ["efficiency"]
+__all__ = ["efficiency", "efficiency_pairs"]
 
 
 def efficiency(G, u, v):
@@ -15,3 +14,35 @@ def efficiency(G, u, v):
     except NoPath:
         eff = 0
     return eff
+
+
+def efficiency_pairs(G, sources, targets):
+    # Batched version of `efficiency` for pairs `zip(sources, targets)`.
+    # Do one multi-source BFS from the unique sources instead of one BFS per pair.
+    # Returns a numpy array of efficiencies; like `efficiency`, it is 0 if there is no path,
+    # and ZeroDivisionError is raised if a source and target are the same node.
+    sources = list(sources)
+    targets = list(targets)
+    if len(sources) != len(targets):
+        raise ValueError("sources and targets must have the same length")
+    if any(source == target for source, target in zip(sources, targets)):
+        raise ZeroDivisionError("efficiency of a node with itself is undefined")
+    unique_sources = list(dict.fromkeys(sources))
+    source_to_row = {source: i for i, source in enumerate(unique_sources)}
+    rows = np.fromiter((source_to_row[source] for source in sources), np.uint64)
+    cols = G.list_to_ids(targets)
+    D = _bfs_levels(G, unique_sources)
+    # Only compute 1 / distance for the pairs we need
+    Mask = Matrix.from_coo(rows, cols, True, nrows=D.nrows, ncols=D.ncols)
+    Eff = unary.minv[float](D).new(mask=Mask.S, name="efficiency_pairs")
+    # Match pairs to values via row-major keys, which are sorted in the COO output
+    ncols = np.uint64(D.ncols)
+    r, c, values = Eff.to_coo()
+    keys = r * ncols + c
+    pair_keys = rows * ncols + cols
+    indices = np.searchsorted(keys, pair_keys)
+    found = indices < keys.size
+    found[found] = keys[indices[found]] == pair_keys[found]
+    rv = np.zeros(len(rows), dtype=np.float64)
+    rv[found] = values[indices[found]]
+    return rv
@@ -1,5 +1,19 @@
+import math
+
 import numpy as np
-from graphblas import Matrix, Vector, binary, indexunary, monoid, replace, select, unary
+from graphblas import Matrix, Vector, binary, indexunary, monoid, replace, select
+from graphblas.dtypes import (
+    BOOL,
+    INT8,
+    INT16,
+    INT32,
+    INT64,
+    UINT8,
+    UINT16,
+    UINT32,
+    UINT64,
+    lookup_dtype,
+)
 from graphblas.semiring import any_pair, min_plus
 
 from .._bfs import _bfs_level, _bfs_levels, _bfs_parent, _bfs_plain
@@ -9,10 +23,53 @@ __all__ = [
     "single_source_bellman_ford_path_length",
     "bellman_ford_path",
     "bellman_ford_path_length",
+    "single_source_bellman_ford_path",
     "bellman_ford_path_lengths",
     "negative_edge_cycle",
 ]
 
+_INT_DTYPES = [INT8, INT16, INT32, INT64]
+_NARROW_INT_DTYPES = {INT8, INT16, INT32, UINT8, UINT16, UINT32, UINT64}
+
+
+def _get_max_abs_weight(G, A):
+    # `A` is "offdiag" with bool or integer values
+    if A.dtype == BOOL:
+        return 1
+    min_val, max_val = G.get_properties("min_element- max_element-")
+    return max(abs(int(min_val.get(0))), abs(int(max_val.get(0))))
+
+
+def _get_path_dtype(G, A, max_abs=None):
+    # Sums of narrow integers along a path (up to n edges) may overflow, so use the
+    # narrowest integer dtype that can hold them, but never narrower than the input.
+    # Bools are upcast to at least INT32 as path lengths.
+    # `max_abs` is the largest absolute weight, which is computed from `A` if not given.
+    dtype = A.dtype
+    if dtype != BOOL and dtype not in _NARROW_INT_DTYPES:
+        return dtype
+    if max_abs is None:
+        max_abs = _get_max_abs_weight(G, A)
+    bound = A.nrows * max_abs
+    min_itemsize = INT32.np_type.itemsize if dtype == BOOL else dtype.np_type.itemsize
+    for int_dtype in _INT_DTYPES:
+        if (
+            int_dtype.np_type.itemsize >= min_itemsize
+            and bound <= np.iinfo(int_dtype.np_type).max
+        ):
+            return int_dtype
+    return INT64 if dtype == BOOL else dtype
+
+
+def _check_iso_negative_source(G, src_id):
+    # Easy negative cycles from the source when all edges have the same negative weight
+    # Use the cached diagonal to check for a (negative) self-loop on the source node
+    if G.get_property("has_self_edges") and src_id in G.get_property("diag"):
+        raise Unbounded("Negative cycle detected.")
+    if not G.is_directed() and src_id in G.get_property("degrees+"):
+        # For undirected graphs, any negative edge is a cycle
+        raise Unbounded("Negative cycle detected.")
+
 
 def _bellman_ford_path_length(G, source, target=None, *, cutoff=None, name):
     # No need for `is_weighted=` keyword, b/c this is assumed to be weighted (I think)
@@ -28,75 +85,88 @@ def _bellman_ford_path_length(G, source, target=None, *, cutoff=None, name):
         if not is_negative:
             if cutoff is not None:
                 cutoff = int(cutoff // iso_value)
-            d = _bfs_level(G, source, target, cutoff=cutoff, dtype=iso_value.dtype)
+            dtype = _get_path_dtype(G, G._A, abs(iso_value.value))
+            d = _bfs_level(G, source, target, cutoff=cutoff, dtype=dtype, scale=iso_value.value)
             if dst_id is not None:
                 d = d.get(dst_id)
                 if d is None:
                     raise NoPath(f"node {target} not reachable from {source}")
-            if iso_value != 1:
-                d *= iso_value
             return d
         # It's difficult to detect negative cycles with BFS
-        if G._A[src_id, src_id].get() is not None:
-            raise Unbounded("Negative cycle detected.")
-        if not G.is_directed() and G._A[src_id, :].nvals > 0:
-            # For undirected graphs, any negative edge is a cycle
-            raise Unbounded("Negative cycle detected.")
+        _check_iso_negative_source(G, src_id)
+
+    # TODO: dispatch to LAGraph's SSSP (delta-stepping) once it is reachable from Python.
+    # python-graphblas only wraps SuiteSparse:GraphBLAS, so we drive the relaxation here.
 
     # Use `offdiag` instead of `A`, b/c self-loops don't contribute to the result,
     # and negative self-loops are easy negative cycles to avoid.
     # We check if we hit a self-loop negative cycle at the end.
-    if dst_id is None:
-        A, has_negative_diagonal = G.get_properties("offdiag has_negative_diagonal")
-    else:
-        A, is_negative, has_negative_diagonal = G.get_properties(
-            "offdiag has_negative_edges- has_negative_diagonal"
-        )
-    if A.dtype == bool:
-        # Should we upcast e.g. INT8 to INT64 as well?
-        dtype = int
-    else:
-        dtype = A.dtype
+    A, is_negative, has_negative_diagonal = G.get_properties(
+        "offdiag has_negative_edges- has_negative_diagonal"
+    )
+    dtype = _get_path_dtype(G, A)
     n = A.nrows
+    num_iters = n - 1
+    packed_parents = None
+    if is_negative:
+        # Negative cycles keep the frontier from emptying. If we haven't converged after
+        # `check_every` iterations, continue while tracking parents to detect them early.
+        packed_parents = _pack_parents(G, A, dtype)
+        if packed_parents is not None:
+            check_every = _get_check_every(n)
+            num_iters = min(num_iters, check_every)
     d = Vector(dtype, n, name="single_source_bellman_ford_path_length")
     d[src_id] = 0
     cur = d.dup(name="cur")
+    # Write the product to a separate buffer so the output doesn't alias the input
+    tmp = Vector(dtype, n, name="tmp")
     mask = Vector(bool, n, name="mask")
-    one = unary.one[bool]
-    for _i in range(n - 1):
-        # This is a slightly modified Bellman-Ford algorithm.
-        # `cur` is the current frontier of values that improved in the previous iteration.
-        # This means that in this iteration we drop values from `cur` that are not better.
-        cur << min_plus(cur @ A)
-        if cutoff is not None:
-            cur << select.valuele(cur, cutoff)
-
-        # Mask is True where cur not in d or cur < d
-        mask << one(cur)
-        mask(binary.second) << binary.lt(cur & d)
-
-        # Drop values from `cur` that didn't improve
-        cur(mask.V, replace) << cur
-        if cur.nvals == 0:
-            break
-        # Update `d` with values that improved
-        d(cur.S) << cur
-        if dst_id is not None and not is_negative:
-            # Limit exploration if we have a target
-            cutoff = cur.get(dst_id, cutoff)
+    # This is a slightly modified Bellman-Ford algorithm.
+    # `cur` is the current frontier of values that improved in the previous iteration.
+    # This means that in each iteration we drop values from `cur` that are not better.
+    # `cur` is empty if and only if the loop below stopped early (i.e., it converged).
+    if cutoff is None and (dst_id is None or is_negative):
+        # `cutoff` is always None here, so use a simpler loop
+        for _i in range(num_iters):
+            tmp << min_plus(cur @ A)
+            # Mask is True where tmp >= d, so its complement is where tmp not in d or tmp < d
+            mask << binary.ge(tmp & d)
+            # Drop values that didn't improve
+            cur(~mask.V, replace) << tmp
+            if cur.nvals == 0:
+                break
+            # Update `d` with values that improved
+            d(cur.S) << cur
     else:
+        for _i in range(num_iters):
+            tmp << min_plus(cur @ A)
+            if cutoff is not None:
+                tmp << select.valuele(tmp, cutoff)
+            mask << binary.ge(tmp & d)
+            cur(~mask.V, replace) << tmp
+            if cur.nvals == 0:
+                break
+            d(cur.S) << cur
+            if dst_id is not None and not is_negative:
+                # Limit exploration if we have a target
+                cutoff = cur.get(dst_id, cutoff)
+    if num_iters < n - 1 and cur.nvals > 0:
+        _continue_with_cycle_checks(
+            G, target, d, cur, *packed_parents, n - 1 - num_iters, check_every, cutoff
+        )
+    if cur.nvals > 0:
         # Check for negative cycle when for loop completes without breaking
-        cur << min_plus(cur @ A)
+        tmp << min_plus(cur @ A)
         if cutoff is not None:
-            cur << select.valuele(cur, cutoff)
-        mask << binary.lt(cur & d)
+            tmp << select.valuele(tmp, cutoff)
+        mask << binary.lt(tmp & d)
         if dst_id is None and mask.reduce(monoid.lor) or dst_id is not None and mask.get(dst_id):
             raise Unbounded("Negative cycle detected.")
     if has_negative_diagonal:
         # We removed diagonal entries above, so check if we visited one with a negative weight
         diag = G.get_property("diag")
         cur << select.valuelt(diag, 0)
-        if any_pair(d @ cur):
+        if binary.pair[bool](d & cur).reduce(monoid.lor):
             raise Unbounded("Negative cycle detected.")
     if dst_id is not None:
         d = d.get(dst_id)
@@ -129,9 +199,8 @@ def bellman_ford_path_lengths(G, nodes=None, *, expand_output=False):
     if G.get_property("is_iso"):
         is_negative, iso_value = G.get_properties("has_negative_edges+ iso_value")
         if not is_negative:
-            D = _bfs_levels(G, nodes, dtype=iso_value.dtype)
-            if iso_value != 1:
-                D *= iso_value
+            dtype = _get_path_dtype(G, G._A, abs(iso_value.value))
+            D = _bfs_levels(G, nodes, dtype=dtype, scale=iso_value.value)
             if nodes is not None and expand_output and D.ncols != D.nrows:
                 ids = G.list_to_ids(nodes)
                 rv = Matrix(D.dtype, D.ncols, D.ncols, name=D.name)
@@ -142,16 +211,14 @@ def bellman_ford_path_lengths(G, nodes=None, *, expand_output=False):
             # For undirected graphs, any negative edge is a cycle
             if nodes is not None:
                 ids = G.list_to_ids(nodes)
-                if G._A[ids, :].nvals > 0:
+                # Use cached degrees, which is cheaper than extracting rows of `A` every call
+                if G.get_property("degrees+")[ids].new().nvals > 0:
                     raise Unbounded("Negative cycle detected.")
             elif G._A.nvals > 0:
                 raise Unbounded("Negative cycle detected.")
 
     A, has_negative_diagonal = G.get_properties("offdiag has_negative_diagonal")
-    if A.dtype == bool:
-        dtype = int
-    else:
-        dtype = A.dtype
+    dtype = _get_path_dtype(G, A)
     n = A.nrows
     if nodes is None:
         # TODO: `D = Vector.from_scalar(0, n, dtype).diag()`
@@ -160,24 +227,28 @@ def bellman_ford_path_lengths(G, nodes=None, *, expand_output=False):
         D = D.diag(name="bellman_ford_path_lengths")
     else:
         ids = G.list_to_ids(nodes)
-        D = Matrix.from_coo(
-            np.arange(len(ids), dtype=np.uint64),
-            ids,
-            0,
-            dtype,
+        # Each row has exactly one entry, so build iso-valued CSR directly (no sorting).
+        # Don't take ownership of `ids`, b/c we may use it again below.
+        D = Matrix.ss.import_csr(
             nrows=len(ids),
             ncols=n,
+            indptr=np.arange(len(ids) + 1, dtype=np.uint64),
+            col_indices=ids,
+            values=np.zeros(1, dtype=lookup_dtype(dtype).np_type),
+            is_iso=True,
+            sorted_cols=True,
             name="bellman_ford_path_lengths",
         )
     Cur = D.dup(name="Cur")
+    Tmp = Matrix(dtype, D.nrows, D.ncols, name="Tmp")
     Mask = Matrix(bool, D.nrows, D.ncols, name="Mask")
-    one = unary.one[bool]
-    for _i in range(n - 1):
-        Cur << min_plus(Cur @ A)
-        Mask << one(Cur)
-        Mask(binary.second) << binary.lt(Cur & D)
-        Cur(Mask.V, replace) << Cur
-        if Cur.nvals == 0:
+    for i in range(n - 1):
+        Tmp << min_plus(Cur @ A)
+        Mask << binary.ge(Tmp & D)
+        Cur(~Mask.V, replace) << Tmp
+        # Getting `nvals` waits for pending work to finish, so only check every 4 iterations
+        # to let GraphBLAS (in non-blocking mode) defer work. Iterations with empty `Cur` are cheap.
+        if i % 4 == 3 and Cur.nvals == 0:
             break
         D(Cur.S) << Cur
     else:
@@ -188,7 +259,7 @@ def bellman_ford_path_lengths(G, nodes=None, *, expand_output=False):
     if has_negative_diagonal:
         diag = G.get_property("diag")
         cur = select.valuelt(diag, 0)
-        if any_pair(D @ cur).nvals > 0:
+        if any_pair[bool](D @ cur).nvals > 0:
             raise Unbounded("Negative cycle detected.")
     if nodes is not None and expand_output and D.ncols != D.nrows:
         rv = Matrix(D.dtype, n, n, name=D.name)
@@ -207,27 +278,133 @@ def _reconstruct_path_from_parents(G, parents, src, dst):
     while cur != src:
         cur = d[cur]
         path.append(cur)
+        if len(path) > len(d):
+            # A cycle in the graph of parents is a negative cycle
+            raise Unbounded("Negative cycle detected.")
     return G.list_to_keys(reversed(path))
 
 
-def bellman_ford_path(G, source, target):
-    src_id = G._key_to_id[source]
-    dst_id = G._key_to_id[target]
-    if G.get_property("is_iso"):
-        # If the edges are iso-valued (and positive), then we can simply do level BFS
-        is_negative = G.get_property("has_negative_edges+")
-        if not is_negative:
-            p = _bfs_parent(G, source, target)
-            return _reconstruct_path_from_parents(G, p, src_id, dst_id)
-        raise Unbounded("Negative cycle detected.")
-    A, is_negative, has_negative_diagonal = G.get_properties(
-        "offdiag has_negative_edges- has_negative_diagonal"
-    )
-    if A.dtype == bool:
-        # Should we upcast e.g. INT8 to INT64 as well?
-        dtype = int
-    else:
-        dtype = A.dtype
+def _reconstruct_paths_from_parents(G, parents, src):
+    indices, values = parents.to_coo(sort=False)
+    d = dict(zip(indices.tolist(), values.tolist()))
+    id_to_key = G.id_to_key
+    paths = {src: [id_to_key[src]]}
+    for index in d:
+        # Walk up the tree until we reach a node whose path we already know
+        stack = []
+        while index not in paths:
+            stack.append(index)
+            index = d[index]
+        path = paths[index]
+        for index in reversed(stack):
+            path = [*path, id_to_key[index]]
+            paths[index] = path
+    return {id_to_key[index]: path for index, path in paths.items()}
+
+
+def _pack_parents(G, A, dtype):
+    # For integer weights, return `A * 2**shift + rowindex(A)` as INT64 and `shift` so both
+    # the distance and the parent can be found with a single `min_plus`, where `2**shift >= n`.
+    # Packed values are `distance * 2**shift + parent`, so `parent` is the low `shift` bits.
+    # Returns None if this may overflow.
+    if dtype not in _INT_DTYPES:
+        return None
+    max_abs = _get_max_abs_weight(G, A)
+    n = A.nrows
+    shift = max(1, (n - 1).bit_length())
+    # Packed values are bounded by (|distance| + |weight| + 1) * 2**shift
+    if ((n + 1) * max_abs + 1) << shift > np.iinfo(np.int64).max:
+        return None
+    P = indexunary.rowindex[INT64](A).new(name="P")
+    P(binary.plus) << binary.times[INT64](A, 1 << shift)
+    return P, shift
+
+
+def _get_check_every(n):
+    # Checking for a cycle in the graph of parents every O(sqrt(n log n)) iterations finds
+    # negative cycles early without changing the asymptotic cost (see Lemmas 5 and 6 of
+    # "Faster Bellman-Ford" by Jin Y. Yen, which bounds how soon cycles appear).
+    return max(1, int(math.sqrt(n * math.log(n)))) if n > 1 else 1
+
+
+def _parent_cycle_nodes(parents):
+    # Each node has at most one parent, so a walk of length n must revisit a node.
+    # Use pointer jumping: after k rounds, `p[i]` is the 2**k-th ancestor of `i`.
+    # Returns the ids of nodes on a cycle of parents or below one (i.e., reachable from it).
+    n = parents.size
+    indices, values = parents.to_coo()
+    p = np.full(n + 1, n, dtype=np.int64)  # `n` means "no parent"
+    p[indices] = values
+    for _i in range(n.bit_length()):
+        p = p[p]
+    return np.flatnonzero(p[:n] != n)
+
+
+def _relax_packed(P, shift, d, prev, num_iters, check_every=None, cutoff=None):
+    # Run up to `num_iters` iterations of Bellman-Ford on packed values (see `_pack_parents`).
+    # `d` and the frontier `prev` hold `distance * 2**shift` and are updated in place;
+    # `prev` is empty if converged. The parent of each improved node is tracked, and every
+    # `check_every` iterations we stop if the graph of parents has a (negative) cycle.
+    # Returns the ids from `_parent_cycle_nodes` (empty if none) and the number of iterations.
+    n = P.nrows
+    low = (1 << shift) - 1
+    cur = Vector(INT64, n, name="cur")
+    tmp = Vector(INT64, n, name="tmp")
+    mask = Vector(bool, n, name="mask")
+    p = Vector(int, n, name="parent")
+    nodes = np.empty(0, dtype=np.int64)
+    i = 0
+    for i in range(1, num_iters + 1):
+        tmp << min_plus(prev @ P)
+        if cutoff is not None:
+            tmp << select.valuele(tmp, cutoff)
+        # Parents are in the low bits of `tmp`, so this compares distances
+        mask << binary.ge(tmp & d)
+        cur(~mask.V, replace) << tmp
+        if cur.nvals == 0:
+            prev.clear()
+            break
+        p(cur.S) << binary.band(cur, low)
+        prev << binary.band(cur, -(1 << shift))
+        d(prev.S) << prev
+        if check_every is not None and i % check_every == 0:
+            nodes = _parent_cycle_nodes(p)
+            if nodes.size > 0:
+                break
+    return nodes, i
+
+
+def _continue_with_cycle_checks(G, target, d, cur, P, shift, num_iters, check_every, cutoff):
+    # Continue Bellman-Ford for `num_iters` iterations from distances `d` and frontier `cur`,
+    # which are updated in place. Raise Unbounded if we find a negative cycle that reaches
+    # `target` (or any negative cycle if `target` is None).
+    scale = 1 << shift
+    d_packed = binary.times[INT64](d, scale).new(name="d_packed")
+    prev = binary.times[INT64](cur, scale).new(name="prev")
+    if cutoff is not None:
+        # Compare distances and ignore parents
+        cutoff = math.floor(cutoff) * scale + scale - 1
+    nodes, i = _relax_packed(P, shift, d_packed, prev, num_iters, check_every, cutoff)
+    if nodes.size > 0:
+        if target is None or G._key_to_id[target] in _bfs_plain(G, index=nodes, target=target):
+            raise Unbounded("Negative cycle detected.")
+        # The negative cycle doesn't reach the target, so finish without checking for cycles
+        _relax_packed(P, shift, d_packed, prev, num_iters - i, cutoff=cutoff)
+    d(d_packed.S) << binary.cdiv(d_packed, scale)
+    cur << binary.cdiv(prev, scale)
+
+
+def _bellman_ford_with_pred(G, src_id, dst_id=None):
+    # Bellman-Ford that also tracks the parent of each node in the shortest path tree.
+    # Returns distances, parents, the final frontier (empty if converged), and the last
+    # iteration number. Raises Unbounded if a negative cycle affects the result.
+    A, is_negative = G.get_properties("offdiag has_negative_edges-")
+    dtype = _get_path_dtype(G, A)
+    packed_parents = _pack_parents(G, A, dtype)
+    if packed_parents is not None:
+        return _bellman_ford_with_pred_packed(
+            src_id, dst_id, *packed_parents, dtype=dtype, is_negative=is_negative
+        )
     cutoff = None
     n = A.nrows
     d = Vector(dtype, n, name="bellman_ford_path_length")
@@ -237,31 +414,31 @@ def bellman_ford_path(G, source, target):
 
     prev = d.dup(name="prev")
     cur = Vector(dtype, n, name="cur")
+    tmp = Vector(dtype, n, name="tmp")
     indices = Vector(int, n, name="indices")
     mask = Vector(bool, n, name="mask")
     B = Matrix(dtype, n, n, name="B")
     Indices = Matrix(int, n, n, name="Indices")
     cols = prev.to_coo(values=False)[0]
-    one = unary.one[bool]
-    for _i in range(n - 1):
+    i = 0
+    for i in range(n - 1):
         # This is a slightly modified Bellman-Ford algorithm.
         # `cur` is the current frontier of values that improved in the previous iteration.
         # This means that in this iteration we drop values from `cur` that are not better.
-        cur << min_plus(prev @ A)
+        tmp << min_plus(prev @ A)
         if cutoff is not None:
-            cur << select.valuele(cur, cutoff)
+            tmp << select.valuele(tmp, cutoff)
 
-        # Mask is True where cur not in d or cur < d
-        mask << one(cur)
-        mask(binary.second) << binary.lt(cur & d)
+        # Mask is True where tmp >= d, so its complement is where tmp not in d or tmp < d
+        mask << binary.ge(tmp & d)
 
-        # Drop values from `cur` that didn't improve
-        cur(mask.V, replace) << cur
+        # Drop values that didn't improve
+        cur(~mask.V, replace) << tmp
         if cur.nvals == 0:
             break
         # Update `d` with values that improved
         d(cur.S) << cur
-        if not is_negative:
+        if dst_id is not None and not is_negative:
             # Limit exploration if we have a target
             cutoff = cur.get(dst_id, cutoff)
 
@@ -288,11 +465,72 @@ def bellman_ford_path(G, source, target):
         if cutoff is not None:
             cur << select.valuele(cur, cutoff)
         mask << binary.lt(cur & d)
-        if mask.get(dst_id):
+        if dst_id is None and mask.reduce(monoid.lor) or dst_id is not None and mask.get(dst_id):
             raise Unbounded("Negative cycle detected.")
+    return d, p, cur, i
+
+
+def _bellman_ford_with_pred_packed(src_id, dst_id, P, shift, *, dtype, is_negative):
+    # Same as `_bellman_ford_with_pred`, but relax packed `distance * 2**shift + parent`
+    # values (see `_pack_parents`), so distances and parents are stored and updated together.
+    n = P.nrows
+    low = (1 << shift) - 1
+    cutoff = None
+    dp = Vector(INT64, n, name="bellman_ford_path_packed")
+    dp[src_id] = src_id
+    # The frontier of distances without parents, `distance * 2**shift`
+    prev = Vector(INT64, n, name="prev")
+    prev[src_id] = 0
+    cur = Vector(INT64, n, name="cur")
+    tmp = Vector(INT64, n, name="tmp")
+    mask = Vector(bool, n, name="mask")
+    i = 0
+    for i in range(n - 1):
+        tmp << min_plus(prev @ P)
+        if cutoff is not None:
+            tmp << select.valuele(tmp, cutoff)
+        # Setting the low bits of `tmp` makes this compare distances and ignore parents
+        cur << binary.bor(tmp, low)
+        mask << binary.ge(cur & dp)
+        cur(~mask.V, replace) << tmp
+        if cur.nvals == 0:
+            break
+        dp(cur.S) << cur
+        if dst_id is not None and not is_negative:
+            # Limit exploration if we have a target (compare distances, not parents)
+            cutoff = cur.get(dst_id, cutoff)
+            if cutoff is not None:
+                cutoff |= low
+        prev << binary.band(cur, -(1 << shift))
+    else:
+        # Check for negative cycle when for loop completes without breaking
+        cur << min_plus(prev @ P)
+        if cutoff is not None:
+            cur << select.valuele(cur, cutoff)
+        tmp << binary.bor(cur, low)
+        mask << binary.lt(tmp & dp)
+        if dst_id is None and mask.reduce(monoid.lor) or dst_id is not None and mask.get(dst_id):
+            raise Unbounded("Negative cycle detected.")
+    p = binary.band[int](dp, low).new(name="bellman_ford_path_parent")
+    dp << binary.band(dp, -(1 << shift))
+    d = binary.cdiv[dtype](dp, 1 << shift).new(name="bellman_ford_path_length")
+    return d, p, cur, i
+
+
+def bellman_ford_path(G, source, target):
+    src_id = G._key_to_id[source]
+    dst_id = G._key_to_id[target]
+    if G.get_property("is_iso"):
+        # If the edges are iso-valued (and positive), then we can simply do level BFS
+        is_negative = G.get_property("has_negative_edges+")
+        if not is_negative:
+            p = _bfs_parent(G, source, target)
+            return _reconstruct_path_from_parents(G, p, src_id, dst_id)
+        raise Unbounded("Negative cycle detected.")
+    _, p, cur, i = _bellman_ford_with_pred(G, src_id, dst_id)
     path = _reconstruct_path_from_parents(G, p, src_id, dst_id)
-    if has_negative_diagonal and path:
-        mask.clear()
+    if G.get_property("has_negative_diagonal") and path:
+        mask = Vector(bool, p.size, name="mask")
         mask[G.list_to_ids(path)] = True
         diag = G.get_property("diag", mask=mask.S)
         if diag.nvals > 0:
@@ -301,15 +539,37 @@ def bellman_ford_path(G, source, target):
         if mask.nvals > 0:
             # Is there a path from any visited node with negative self-loop to target?
             # We could actually stop as soon as any from `path` is visited
-            indices, _ = mask.to_coo(values=False)[0]
-            q = _bfs_plain(G, target=target, index=indices, cutoff=_i)
+            indices = mask.to_coo(values=False)[0]
+            q = _bfs_plain(G, target=target, index=indices, cutoff=i)
             if dst_id in q:
                 raise Unbounded("Negative cycle detected.")
     return path
 
 
-def negative_edge_cycle(G):
-    # TODO: use a heuristic to try to stop early
+def single_source_bellman_ford_path(G, source):
+    src_id = G._key_to_id[source]
+    if G.get_property("is_iso"):
+        # If the edges are iso-valued (and positive), then we can simply do level BFS
+        is_negative = G.get_property("has_negative_edges+")
+        if not is_negative:
+            p = _bfs_parent(G, source)
+            return _reconstruct_paths_from_parents(G, p, src_id)
+        # It's difficult to detect negative cycles with BFS
+        _check_iso_negative_source(G, src_id)
+    d, p, cur, _ = _bellman_ford_with_pred(G, src_id)
+    if G.get_property("has_negative_diagonal"):
+        # We removed diagonal entries above, so check if we visited one with a negative weight
+        diag = G.get_property("diag")
+        cur << select.valuelt(diag, 0)
+        if binary.pair[bool](d & cur).reduce(monoid.lor):
+            raise Unbounded("Negative cycle detected.")
+    return _reconstruct_paths_from_parents(G, p, src_id)
+
+
+def negative_edge_cycle(G, *, heuristic=True):
+    # TODO: this (and `bellman_ford_path_lengths`) is a good fit for GPUs. Consider running
+    # in a `graphblas.ss.Context` with `gpu_id` set once SuiteSparse:GraphBLAS builds with
+    # a CUDA backend are available; the loop body would not need to change.
     if G.is_directed():
         deg = "total_degrees-"
     else:
@@ -321,27 +581,44 @@ def negative_edge_cycle(G):
         return True
     if not has_negative_edges:
         return False
-    if A.dtype == bool:
-        # Should we upcast e.g. INT8 to INT64 as well?
-        dtype = int
-    else:
-        dtype = A.dtype
+    dtype = _get_path_dtype(G, A)
     n = A.nrows
+    if heuristic:
+        # Tracking parents to find negative cycles early is only done for integer weights,
+        # which we pack with the parent. This makes each iteration more expensive (about
+        # 1.5x slower on graphs that take many iterations and have no negative cycles).
+        packed_parents = _pack_parents(G, A, dtype)
+        if packed_parents is not None:
+            P, shift = packed_parents
+            # Begin from every node that has edges
+            d = Vector(INT64, n, name="negative_edge_cycle")
+            d(degrees.S) << 0
+            prev = d.dup(name="prev")
+            nodes, _ = _relax_packed(P, shift, d, prev, n - 1, _get_check_every(n))
+            if nodes.size > 0:
+                return True
+            if prev.nvals == 0:
+                return False
+            # Parents are in the low bits, so this compares distances
+            cur = min_plus(prev @ P).new(name="cur")
+            mask = binary.lt(cur & d).new(name="mask")
+            return bool(mask.reduce(monoid.lor))
     # Begin from every node that has edges
     d = Vector(dtype, n, name="negative_edge_cycle")
     d(degrees.S) << 0
-    cur = d.dup(name="cur")
+    prev = d.dup(name="prev")
+    cur = Vector(dtype, n, name="cur")
+    tmp = Vector(dtype, n, name="tmp")
     mask = Vector(bool, n, name="mask")
-    one = unary.one[bool]
-    for _i in range(n - 1):
-        cur << min_plus(cur @ A)
-        mask << one(cur)
-        mask(binary.second) << binary.lt(cur & d)
-        cur(mask.V, replace) << cur
+    for _i in range(1, n):
+        tmp << min_plus(prev @ A)
+        mask << binary.ge(tmp & d)
+        cur(~mask.V, replace) << tmp
         if cur.nvals == 0:
             return False
         d(cur.S) << cur
-    cur << min_plus(cur @ A)
+        prev, cur = cur, prev
+    cur << min_plus(prev @ A)
     mask << binary.lt(cur & d)
     if mask.reduce(monoid.lor):
         return True
@@ -0,0 +1,29 @@
+import random
+
+import graphblas as gb
+import pytest
+
+from graphblas_algorithms import DiGraph
+from graphblas_algorithms.algorithms._bfs import _bfs_levels
+
+
+def test_bfs_levels_heuristic():
+    rng = random.Random(0)
+    n = 50
+    A = gb.Matrix(bool, n, n)
+    for _ in range(150):
+        A[rng.randrange(n), rng.randrange(n)] = True
+    for i in range(0, n, 5):
+        A[i, i] = True  # self-loops
+    G = DiGraph(A)
+    assert G.get_property("has_self_edges")
+    for nodes in [None, [0, 3, 7], [1]]:
+        expected = _bfs_levels(G, nodes, heuristic="push")
+        assert expected.nvals > (n if nodes is None else len(nodes))
+        for heuristic in [None, "pull"]:
+            result = _bfs_levels(G, nodes, heuristic=heuristic)
+            assert result.isequal(expected), (nodes, heuristic)
+        result = _bfs_levels(G, nodes, cutoff=2, heuristic="pull")
+        assert result.isequal(_bfs_levels(G, nodes, cutoff=2, heuristic="push"))
+    with pytest.raises(ValueError, match="heuristic"):
+        _bfs_levels(G, [0], heuristic="both")
@@ -0,0 +1,37 @@
+import random
+
+import graphblas as gb
+import numpy as np
+import pytest
+
+from graphblas_algorithms import Graph
+from graphblas_algorithms.algorithms import efficiency_measures
+
+
+def test_efficiency_pairs():
+    rng = random.Random(0)
+    n = 30
+    A = gb.Matrix(bool, n, n)
+    # Two components, so some pairs have no path
+    for _ in range(25):
+        u, v = rng.sample(range(n // 2), 2)
+        A[u, v] = A[v, u] = True
+        u, v = rng.sample(range(n // 2, n), 2)
+        A[u, v] = A[v, u] = True
+    G = Graph(A)
+    pairs = [rng.sample(range(n), 2) for _ in range(100)]
+    sources, targets = zip(*pairs)
+    expected = [efficiency_measures.efficiency(G, u, v) for u, v in pairs]
+    assert 0 in expected
+    result = efficiency_measures.efficiency_pairs(G, sources, targets)
+    np.testing.assert_allclose(result, expected)
+    # Iterators
+    result = efficiency_measures.efficiency_pairs(G, iter(sources), iter(targets))
+    np.testing.assert_allclose(result, expected)
+    # Same as `efficiency` for a node with itself
+    with pytest.raises(ZeroDivisionError):
+        efficiency_measures.efficiency(G, 0, 0)
+    with pytest.raises(ZeroDivisionError):
+        efficiency_measures.efficiency_pairs(G, [1, 0], [2, 0])
+    with pytest.raises(ValueError, match="same length"):
+        efficiency_measures.efficiency_pairs(G, [1, 0], [2])
@@ -0,0 +1,50 @@
+import graphblas as gb
+
+from graphblas_algorithms import DiGraph
+from graphblas_algorithms.algorithms import shortest_paths
+
+
+def _int8_chain(n, iso):
+    # Path graph 0 -> 1 -> ... -> n with int8 weights; sums overflow int8
+    A = gb.Matrix(gb.dtypes.INT8, n + 1, n + 1)
+    for i in range(n):
+        A[i, i + 1] = 10 if iso or i % 2 else 9
+    return DiGraph(A)
+
+
+def test_bellman_ford_int8_overflow():
+    for iso, expected in [(True, 600), (False, 570)]:
+        G = _int8_chain(60, iso)
+        assert G.get_property("is_iso") == iso
+        assert shortest_paths.bellman_ford_path_length(G, 0, 60) == expected
+        d = shortest_paths.single_source_bellman_ford_path_length(G, 0)
+        assert d[60].new() == expected
+        D = shortest_paths.bellman_ford_path_lengths(G, [0])
+        assert D[0, 60].new() == expected
+        D = shortest_paths.bellman_ford_path_lengths(G)
+        assert D[0, 60].new() == expected
+        # Upcast enough to hold path lengths
+        assert D.dtype in {gb.dtypes.INT16, gb.dtypes.INT32, gb.dtypes.INT64}
+
+
+def test_bellman_ford_dtype_not_narrowed():
+    A = gb.Matrix(gb.dtypes.INT32, 3, 3)
+    A[0, 1] = 1
+    A[1, 2] = 2
+    G = DiGraph(A)
+    assert shortest_paths.single_source_bellman_ford_path_length(G, 0).dtype == gb.dtypes.INT32
+    assert shortest_paths.bellman_ford_path_lengths(G).dtype == gb.dtypes.INT32
+
+
+def test_bellman_ford_bool_dtype():
+    # Bool weights are path lengths, which shouldn't be narrower than INT32
+    n = 100
+    A = gb.Matrix(bool, n, n)
+    for i in range(n - 1):
+        A[i, i + 1] = True
+    G = DiGraph(A)
+    d = shortest_paths.single_source_bellman_ford_path_length(G, 0)
+    assert d.dtype == gb.dtypes.INT32
+    D = shortest_paths.bellman_ford_path_lengths(G)
+    assert D.dtype == gb.dtypes.INT32
+    assert D.reduce_rowwise().new()[0].new() == n * (n - 1) // 2
@@ -142,6 +142,7 @@ class Dispatcher:
     bellman_ford_path = mod.weighted.bellman_ford_path
     bellman_ford_path_length = mod.weighted.bellman_ford_path_length
     negative_edge_cycle = mod.weighted.negative_edge_cycle
+    single_source_bellman_ford_path = mod.weighted.single_source_bellman_ford_path
     single_source_bellman_ford_path_length = mod.weighted.single_source_bellman_ford_path_length
 
     mod = nxapi.simple_paths
@@ -1,41 +1,165 @@
-from .boundary import *
-from .centrality import *
-from .cluster import *
-from .community import *
-from .components import *
-from .core import *
-from .cuts import *
-from .dag import *
-from .dominating import *
-from .efficiency_measures import *
-from .generators import *
-from .isolate import *
-from .isomorphism import fast_could_be_isomorphic, faster_could_be_isomorphic
-from .linalg import *
-from .link_analysis import *
-from .lowest_common_ancestors import *
-from .operators import *
-from .reciprocity import *
-from .regular import *
-from .shortest_paths import *
-from .simple_paths import *
-from .smetric import *
-from .structuralholes import *
-from .traversal import *
-from .triads import *
-from .tournament import is_tournament
-
-from . import centrality
-from . import cluster
-from . import community
-from . import components
-from . import efficiency_measures
-from . import generators
-from . import isomorphism
-from . import linalg
-from . import link_analysis
-from . import lowest_common_ancestors
-from . import operators
-from . import shortest_paths
-from . import tournament
-from . import traversal
+"""NetworkX-compatible API.
+
+Submodules and the functions they provide are imported lazily on first access (PEP 562),
+so importing this package doesn't import every algorithm.
+"""
+import importlib
+
+_submodules = {
+    "boundary",
+    "centrality",
+    "cluster",
+    "community",
+    "components",
+    "core",
+    "cuts",
+    "dag",
+    "dominating",
+    "efficiency_measures",
+    "generators",
+    "isolate",
+    "isomorphism",
+    "linalg",
+    "link_analysis",
+    "lowest_common_ancestors",
+    "operators",
+    "reciprocity",
+    "regular",
+    "shortest_paths",
+    "simple_paths",
+    "smetric",
+    "structuralholes",
+    "tournament",
+    "traversal",
+    "triads",
+}
+
+# {function_name: submodule}
+_lazy_functions = {
+    # boundary
+    "edge_boundary": "boundary",
+    "node_boundary": "boundary",
+    # centrality
+    "degree_centrality": "centrality",
+    "eigenvector_centrality": "centrality",
+    "in_degree_centrality": "centrality",
+    "katz_centrality": "centrality",
+    "out_degree_centrality": "centrality",
+    # cluster
+    "average_clustering": "cluster",
+    "clustering": "cluster",
+    "generalized_degree": "cluster",
+    "square_clustering": "cluster",
+    "transitivity": "cluster",
+    "triangles": "cluster",
+    # components
+    "is_connected": "components",
+    "is_weakly_connected": "components",
+    "node_connected_component": "components",
+    # core
+    "k_truss": "core",
+    # cuts
+    "boundary_expansion": "cuts",
+    "conductance": "cuts",
+    "cut_size": "cuts",
+    "edge_expansion": "cuts",
+    "mixing_expansion": "cuts",
+    "node_expansion": "cuts",
+    "normalized_cut_size": "cuts",
+    "volume": "cuts",
+    # dag
+    "ancestors": "dag",
+    "descendants": "dag",
+    # dominating
+    "is_dominating_set": "dominating",
+    # efficiency_measures
+    "efficiency": "efficiency_measures",
+    # generators
+    "ego_graph": "generators",
+    # isolate
+    "is_isolate": "isolate",
+    "isolates": "isolate",
+    "number_of_isolates": "isolate",
+    # isomorphism
+    "fast_could_be_isomorphic": "isomorphism",
+    "faster_could_be_isomorphic": "isomorphism",
+    # linalg
+    "adjacency_matrix": "linalg",
+    "bethe_hessian_matrix": "linalg",
+    "directed_modularity_matrix": "linalg",
+    "laplacian_matrix": "linalg",
+    "modularity_matrix": "linalg",
+    "normalized_laplacian_matrix": "linalg",
+    # link_analysis
+    "google_matrix": "link_analysis",
+    "hits": "link_analysis",
+    "pagerank": "link_analysis",
+    # lowest_common_ancestors
+    "lowest_common_ancestor": "lowest_common_ancestors",
+    # operators
+    "complement": "operators",
+    "compose": "operators",
+    "difference": "operators",
+    "disjoint_union": "operators",
+    "full_join": "operators",
+    "intersection": "operators",
+    "reverse": "operators",
+    "symmetric_difference": "operators",
+    "union": "operators",
+    # reciprocity
+    "overall_reciprocity": "reciprocity",
+    "reciprocity": "reciprocity",
+    # regular
+    "is_k_regular": "regular",
+    "is_regular": "regular",
+    # shortest_paths
+    "all_pairs_bellman_ford_path_length": "shortest_paths",
+    "all_pairs_shortest_path_length": "shortest_paths",
+    "bellman_ford_path": "shortest_paths",
+    "bellman_ford_path_length": "shortest_paths",
+    "floyd_warshall": "shortest_paths",
+    "floyd_warshall_numpy": "shortest_paths",
+    "floyd_warshall_predecessor_and_distance": "shortest_paths",
+    "has_path": "shortest_paths",
+    "negative_edge_cycle": "shortest_paths",
+    "single_source_bellman_ford_path": "shortest_paths",
+    "single_source_bellman_ford_path_length": "shortest_paths",
+    "single_source_shortest_path_length": "shortest_paths",
+    "single_target_shortest_path_length": "shortest_paths",
+    # simple_paths
+    "is_simple_path": "simple_paths",
+    # smetric
+    "s_metric": "smetric",
+    # tournament
+    "is_tournament": "tournament",
+    # traversal
+    "bfs_layers": "traversal",
+    "descendants_at_distance": "traversal",
+    # triads
+    "is_triad": "triads",
+}
+
+__all__ = sorted(_lazy_functions.keys() | _submodules)
+
+
+def __getattr__(name):
+    if name in _lazy_functions:
+        module = importlib.import_module(f".{_lazy_functions[name]}", __name__)
+        rv = getattr(module, name)
+    elif name in _submodules:
+        rv = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = rv
+    return rv
+
+
+def __dir__():
+    return sorted(globals().keys() | _lazy_functions.keys() | _submodules)
+
+
+# Functions take priority over submodules with the same name (e.g. `reciprocity`). Importing
+# a submodule sets it as an attribute of this package, so bind these functions eagerly.
+for _name in _lazy_functions.keys() & _submodules:
+    globals()[_name] = getattr(importlib.import_module(f".{_name}", __name__), _name)
+del _name
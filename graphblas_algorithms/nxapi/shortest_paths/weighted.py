@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
 from graphblas_algorithms import algorithms, exceptions
 from graphblas_algorithms.classes.digraph import to_graph
 
@@ -9,6 +12,7 @@ __all__ = [
     "bellman_ford_path",
     "bellman_ford_path_length",
     "negative_edge_cycle",
+    "single_source_bellman_ford_path",
     "single_source_bellman_ford_path_length",
 ]
 
@@ -17,9 +21,10 @@ def all_pairs_bellman_ford_path_length(G, weight="weight", *, chunksize="10 MiB"
     # Larger chunksize offers more parallelism, but uses more memory.
     # Chunksize indicates for how many source nodes to compute at one time.
     # The default is to choose the number of rows so the result, if dense,
-    # will be about 10MB.
+    # will be about 10MB. When computing in chunks, the next chunk is computed
+    # while the current one is yielded, so a memory budget is split between the two.
     G = to_graph(G, weight=weight)
-    chunksize = normalize_chunksize(chunksize, len(G) * G._A.dtype.np_type.itemsize, len(G))
+    chunksize = normalize_chunksize(chunksize, 2 * len(G) * G._A.dtype.np_type.itemsize, len(G))
     if chunksize is None:
         # All at once
         try:
@@ -35,14 +40,50 @@ def all_pairs_bellman_ford_path_length(G, weight="weight", *, chunksize="10 MiB"
                 raise NetworkXUnbounded(*e.args) from e
             yield (source, G.vector_to_nodemap(d))
     else:
-        for cur_nodes in partition(chunksize, list(G)):
-            try:
-                D = algorithms.bellman_ford_path_lengths(G, cur_nodes)
-            except algorithms.exceptions.Unbounded as e:
-                raise NetworkXUnbounded(*e.args) from e
-            for i, source in enumerate(cur_nodes):
-                d = D[i, :].new(name=f"all_pairs_bellman_ford_path_length_{i}")
-                yield (source, G.vector_to_nodemap(d))
+        # Compute the next chunk in a background thread while we convert and yield the
+        # current chunk. GraphBLAS releases the GIL, so this overlaps with Python work.
+        # The first chunk is computed in this thread to populate the cache of G, so the
+        # background thread only reads from G.
+        chunks = partition(chunksize, list(G))
+        cur_nodes = next(chunks)
+        try:
+            D = algorithms.bellman_ford_path_lengths(G, cur_nodes)
+        except algorithms.exceptions.Unbounded as e:
+            raise NetworkXUnbounded(*e.args) from e
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = None
+        try:
+            for next_nodes in chain(chunks, [None]):
+                if next_nodes is not None:
+                    future = executor.submit(algorithms.bellman_ford_path_lengths, G, next_nodes)
+                for i, source in enumerate(cur_nodes):
+                    d = D[i, :].new(name=f"all_pairs_bellman_ford_path_length_{i}")
+                    yield (source, G.vector_to_nodemap(d))
+                if next_nodes is None:
+                    break
+                try:
+                    D = future.result()
+                except algorithms.exceptions.Unbounded as e:
+                    raise NetworkXUnbounded(*e.args) from e
+                cur_nodes = next_nodes
+        finally:
+            # Don't wait for a prefetched chunk if we stop early (e.g., the generator is closed).
+            # A chunk that already started can't be interrupted, so it finishes in the
+            # background (still reading G) and its result is discarded.
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+def single_source_bellman_ford_path(G, source, weight="weight"):
+    # TODO: what if weight is a function?
+    G = to_graph(G, weight=weight)
+    try:
+        return algorithms.single_source_bellman_ford_path(G, source)
+    except algorithms.exceptions.Unbounded as e:
+        raise NetworkXUnbounded(*e.args) from e
+    except KeyError as e:
+        raise NodeNotFound(*e.args) from e
 
 
 def single_source_bellman_ford_path_length(G, source, weight="weight"):
@@ -62,6 +103,8 @@ def bellman_ford_path(G, source, target, weight="weight"):
     G = to_graph(G, weight=weight)
     try:
         return algorithms.bellman_ford_path(G, source, target)
+    except algorithms.exceptions.Unbounded as e:
+        raise NetworkXUnbounded(*e.args) from e
     except KeyError as e:
         raise NodeNotFound(*e.args) from e
 
@@ -70,6 +113,8 @@ def bellman_ford_path_length(G, source, target, weight="weight"):
     G = to_graph(G, weight=weight)
     try:
         return algorithms.bellman_ford_path_length(G, source, target)
+    except algorithms.exceptions.Unbounded as e:
+        raise NetworkXUnbounded(*e.args) from e
     except KeyError as e:
         raise NodeNotFound(*e.args) from e
     except exceptions.NoPath as e:
@@ -78,6 +123,5 @@ def bellman_ford_path_length(G, source, target, weight="weight"):
 
 def negative_edge_cycle(G, weight="weight", heuristic=True):
     # TODO: what if weight is a function?
-    # TODO: use a heuristic to try to stop early
     G = to_graph(G, weight=weight)
-    return algorithms.negative_edge_cycle(G)
+    return algorithms.negative_edge_cycle(G, heuristic=heuristic)
@@ -0,0 +1,47 @@
+import inspect
+import subprocess
+import sys
+
+from graphblas_algorithms import nxapi
+
+# Only some functions from these submodules are available in `nxapi`
+PARTIAL_SUBMODULES = {"isomorphism", "tournament"}
+
+
+def _star_exports(submodule):
+    namespace = {}
+    exec(f"from graphblas_algorithms.nxapi.{submodule} import *", namespace)
+    return {
+        key
+        for key, val in namespace.items()
+        if not key.startswith("_")
+        and inspect.isfunction(val)
+        and val.__module__.startswith("graphblas_algorithms.nxapi")
+    }
+
+
+def test_lazy_functions_match_submodules():
+    for submodule in nxapi._submodules:
+        exports = _star_exports(submodule)
+        names = {key for key, val in nxapi._lazy_functions.items() if val == submodule}
+        assert names <= exports, submodule
+        if submodule not in PARTIAL_SUBMODULES:
+            assert names == exports, f"Add to nxapi._lazy_functions: {exports - names}"
+    for name in nxapi.__all__:
+        assert getattr(nxapi, name) is not None
+
+
+def test_function_shadows_submodule():
+    # Importing the `reciprocity` submodule must not replace the `reciprocity` function
+    code = """
+import inspect
+from graphblas_algorithms.nxapi.reciprocity import overall_reciprocity
+from graphblas_algorithms import nxapi
+from graphblas_algorithms.interface import Dispatcher
+nxapi.overall_reciprocity
+assert inspect.isfunction(nxapi.reciprocity), nxapi.reciprocity
+assert inspect.isfunction(Dispatcher.reciprocity), Dispatcher.reciprocity
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+    nxapi.overall_reciprocity
+    assert inspect.isfunction(nxapi.reciprocity)
@@ -0,0 +1,121 @@
+import random
+
+import networkx as nx
+import pytest
+
+from graphblas_algorithms import DiGraph, Graph, algorithms, nxapi
+
+
+def _random_graph(seed, *, n=20, directed=True, negative=True, floats=False):
+    rng = random.Random(seed)
+    G = nx.gnp_random_graph(n, 0.15, directed=directed, seed=seed)
+    low = -2 if negative else 0
+    for u, v in G.edges:
+        weight = rng.randint(low, 9)
+        G[u][v]["weight"] = weight + 0.5 if floats else weight
+    return G
+
+
+def _to_graph(G):
+    return (DiGraph if G.is_directed() else Graph).from_networkx(G, weight="weight")
+
+
+@pytest.mark.parametrize("heuristic", [True, False])
+@pytest.mark.parametrize("floats", [False, True])
+def test_negative_edge_cycle(heuristic, floats):
+    for seed in range(30):
+        G = _random_graph(seed, floats=floats)
+        expected = nx.negative_edge_cycle(G)
+        assert nxapi.negative_edge_cycle(_to_graph(G), heuristic=heuristic) == expected, seed
+    # Long chain with negative weights and no cycle (many iterations), then add a cycle
+    G = nx.DiGraph()
+    nx.add_path(G, range(200), weight=-1)
+    G.add_edge(0, 199, weight=300)
+    assert not nxapi.negative_edge_cycle(_to_graph(G), heuristic=heuristic)
+    G.add_edge(20, 0, weight=5)
+    assert nxapi.negative_edge_cycle(_to_graph(G), heuristic=heuristic)
+
+
+def _path_length(G, path):
+    return sum(G[u][v]["weight"] for u, v in zip(path, path[1:]))
+
+
+def _check_bellman_ford_paths(G):
+    G2 = _to_graph(G)
+    try:
+        expected_lengths, _ = nx.single_source_bellman_ford(G, 0)
+    except nx.NetworkXUnbounded:
+        with pytest.raises(nx.NetworkXUnbounded):
+            nxapi.single_source_bellman_ford_path(G2, 0)
+        with pytest.raises(algorithms.exceptions.Unbounded):
+            for target in G:
+                algorithms.bellman_ford_path(G2, 0, target)
+        return False
+    paths = nxapi.single_source_bellman_ford_path(G2, 0)
+    assert paths.keys() == expected_lengths.keys()
+    for target, path in paths.items():
+        assert path[0] == 0
+        assert path[-1] == target
+        assert _path_length(G, path) == expected_lengths[target]
+        path = algorithms.bellman_ford_path(G2, 0, target)
+        assert path[0] == 0
+        assert path[-1] == target
+        assert _path_length(G, path) == expected_lengths[target]
+    return True
+
+
+@pytest.mark.parametrize("floats", [False, True])  # packed parents and the fallback
+def test_single_source_bellman_ford_path(floats):
+    num_bounded = 0
+    for seed in range(30):
+        G = _random_graph(seed, directed=seed % 3 != 0, negative=seed % 2 == 0, floats=floats)
+        G.add_node(len(G))  # unreachable
+        num_bounded += _check_bellman_ford_paths(G)
+        # Negative self-loops are negative cycles only if reachable
+        G.add_edge(len(G) - 1, len(G) - 1, weight=-1)
+        _check_bellman_ford_paths(G)
+        G.add_edge(1, 1, weight=-1)
+        _check_bellman_ford_paths(G)
+    assert num_bounded > 10
+
+
+def test_all_pairs_bellman_ford_path_length_chunks():
+    G = _random_graph(1, negative=False)
+    expected = list(nx.all_pairs_bellman_ford_path_length(G))
+    result = list(nxapi.all_pairs_bellman_ford_path_length(_to_graph(G), chunksize=3))
+    assert result == expected
+    # Stop early while the next chunk may still be computing
+    it = nxapi.all_pairs_bellman_ford_path_length(_to_graph(G), chunksize=3)
+    assert next(it) == expected[0]
+    it.close()
+    # Negative cycle is only reachable from the last chunk
+    G = nx.DiGraph()
+    nx.add_path(G, range(6), weight=1)
+    nx.add_path(G, [6, 7, 8], weight=1)
+    G.add_edge(8, 7, weight=-2)
+    it = nxapi.all_pairs_bellman_ford_path_length(_to_graph(G), chunksize=3)
+    sources = []
+    with pytest.raises(nx.NetworkXUnbounded):
+        for source, _ in it:
+            sources.append(source)
+    assert sources == list(range(6))
+
+
+@pytest.mark.parametrize("floats", [False, True])  # with and without checking parents
+def test_bellman_ford_path_length_negative_cycle(floats):
+    # Long chain with negative weights (many iterations) and a negative cycle on 0 -> 20
+    G = nx.DiGraph()
+    nx.add_path(G, range(200), weight=-1.5 if floats else -1)
+    G.add_edge(20, 0, weight=5)
+    G.add_edge(300, 0, weight=1)
+    G.add_edge(300, 301, weight=2)
+    G2 = _to_graph(G)
+    with pytest.raises(nx.NetworkXUnbounded):
+        nxapi.single_source_bellman_ford_path_length(G2, 0)
+    with pytest.raises(nx.NetworkXUnbounded):
+        nxapi.single_source_bellman_ford_path_length(G2, 300)
+    if not floats:
+        # Only targets reachable from the cycle are affected
+        with pytest.raises(nx.NetworkXUnbounded):
+            nxapi.bellman_ford_path_length(G2, 300, 150)
+        assert nxapi.bellman_ford_path_length(G2, 300, 301) == 2
@@ -66,9 +66,13 @@ def nx_info():
 @pytest.fixture(scope="module")
 def gb_info():
     rv = {}  # {modulepath: {dispatchname: NameInfo}}
-    from graphblas_algorithms import nxapi  # noqa: F401
+    from graphblas_algorithms import nxapi
     from graphblas_algorithms.interface import Dispatcher
 
+    # Functions in `nxapi` are loaded lazily, so load them all
+    for name in nxapi.__all__:
+        getattr(nxapi, name)
+
     ga_map = {
         fullname(val): key
         for key, val in vars(Dispatcher).items()